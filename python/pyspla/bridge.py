@@ -1,5 +1,13 @@
 """
 Wrapped native (spla C API) raw functions access.
+
+Bindings stay on ctypes deliberately: the package ships as a pure-python
+wheel with prebuilt shared libraries per platform, so a compiled extension
+module (pybind11/nanobind) would add a build step and per-python-version
+wheels for a dispatch win that matters only on very fine-grained calls.
+Hot paths compensate inside ctypes instead: direct CFUNCTYPE function
+pointers for the Exec family and zero-copy MemView construction over
+python buffers for bulk data exchange.
 """
 
 __copyright__ = "Copyright (c) 2021-2023 SparseLinearAlgebra"
@@ -26,36 +34,92 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-__all__ = ["backend", "check", "is_docs", "FormatMatrix", "FormatVector"]
+__all__ = [
+    "backend",
+    "check",
+    "get_accelerator_info",
+    "is_docs",
+    "shutdown",
+    "spla_runtime",
+    "FormatMatrix",
+    "FormatVector",
+]
 
 import os
 import ctypes
-import pathlib
+import contextlib
 import platform
 import atexit
 import enum
 
-ARCH = {"AMD64": "x64", "x86_64": "x64", "arm64": "arm64"}[platform.machine()]
-SYSTEM = {"Darwin": "macos", "Linux": "linux", "Windows": "windows"}[platform.system()]
-TARGET_SUFFIX = {"macos": ".dylib", "linux": ".so", "windows": ".dll"}[SYSTEM]
-TARGET = (
-    {"macos": "libspla", "linux": "libspla", "windows": "spla"}[SYSTEM]
-    + "_"
-    + ARCH
-    + TARGET_SUFFIX
-)
+def target_library_name():
+    """
+    File name of the native library to load on this platform.
+
+    Prefers the constant baked at build time for platform-specific
+    distributions, so the platform probes below only run in source
+    checkouts and only when the library is actually loaded.
+
+    :return: Target library file name.
+    """
+
+    try:
+        from ._build_info import TARGET
+        return TARGET
+    except ImportError:
+        pass
+
+    machine = platform.machine()
+    system = platform.system()
+
+    arch = {"AMD64": "x64", "x86_64": "x64", "arm64": "arm64"}.get(machine)
+    system_name = {"Darwin": "macos", "Linux": "linux", "Windows": "windows"}.get(system)
+
+    if arch is None or system_name is None:
+        raise SplaFailedInitialize(f"unsupported platform {system} {machine}")
+
+    suffix = {"macos": ".dylib", "linux": ".so", "windows": ".dll"}[system_name]
+    prefix = {"macos": "libspla", "linux": "libspla", "windows": "spla"}[system_name]
+    return prefix + "_" + arch + suffix
 
 _spla_path = None
 _spla = None
-_int = None
-_enum_t = None
-_status_t = None
-_object_t = None
-_p_object_t = None
-_callback_t = None
 _default_callback = None
 _is_docs = False
 
+# Reused across get_accelerator_info queries to avoid a 4 KiB alloc per call
+_ACCEL_INFO_BUF_SIZE = 4096
+_ACCEL_INFO_BUF = (ctypes.c_char * _ACCEL_INFO_BUF_SIZE)()
+
+_int = ctypes.c_int
+_uint = ctypes.c_uint
+_float = ctypes.c_float
+_p_int = ctypes.POINTER(ctypes.c_int)
+_p_uint = ctypes.POINTER(ctypes.c_uint)
+_p_float = ctypes.POINTER(ctypes.c_float)
+_p_void_p = ctypes.POINTER(ctypes.c_void_p)
+_p_size_t = ctypes.POINTER(ctypes.c_size_t)
+_enum_t = ctypes.c_uint
+_status_t = ctypes.c_uint
+_object_t = ctypes.c_void_p
+_p_object_t = ctypes.POINTER(_object_t)
+
+# Message callback factory is constructed once; each CFUNCTYPE call would
+# otherwise create a whole new ctypes type.
+#
+# NOTE: must stay CFUNCTYPE, not PYFUNCTYPE. CFUNCTYPE re-acquires the GIL
+# only for the python callback body, while PYFUNCTYPE would pin the GIL for
+# the whole native call it is passed into.
+_callback_t = ctypes.CFUNCTYPE(
+    None,
+    ctypes.c_int,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_char_p,
+    ctypes.c_int,
+    ctypes.c_void_p,
+)
+
 
 class SplaError(Exception):
     pass
@@ -97,7 +161,7 @@ class SplaNotImplemented(SplaError):
     pass
 
 
-class FormatMatrix(enum.Enum):
+class FormatMatrix(enum.IntEnum):
     """
     Mapping for spla supported matrix storage formats enumeration.
 
@@ -125,7 +189,7 @@ class FormatMatrix(enum.Enum):
     COUNT = 8
 
 
-class FormatVector(enum.Enum):
+class FormatVector(enum.IntEnum):
     """
     Mapping for spla supported vector storage formats enumeration.
 
@@ -146,6 +210,11 @@ class FormatVector(enum.Enum):
     COUNT = 5
 
 
+# Statuses map to exception classes, not pre-made instances: a raised
+# instance accumulates `__traceback__` frames and `__context__` links, so
+# a module-level singleton would pin every raising frame for the life of
+# the process. Raising the class lets CPython construct a fresh instance
+# per failure, which is the unavoidable part of the cost.
 _status_mapping = {
     1: SplaError,
     2: SplaNoAcceleration,
@@ -157,646 +226,269 @@ _status_mapping = {
     1024: SplaNotImplemented,
 }
 
+# Dense code-indexed table of exception classes used by `check`, which
+# runs after every native call; indexing skips the dict hash on the error
+# path, raising the class constructs a fresh instance, and unknown codes
+# fall back to the base error
+_STATUS_EXC = tuple(_status_mapping.get(code, SplaError) for code in range(1025))
+_STATUS_COUNT = len(_STATUS_EXC)
+
+# Status names pre-encoded for the message callback, which stays on bytes
+_STATUS_BYTES = {code: cls.__name__.encode("utf-8") for code, cls in _status_mapping.items()}
+
+
+# Shared singletons for the most common prototype shapes, so identical
+# argtypes sequences are not allocated per entry point.
+_ARGS_EMPTY = ()
+_ARGS_OBJ = (_object_t,)
+_RET_OBJ = _object_t
+
+# Exec entry points end with a spla_ScheduleTask* out-parameter and take
+# mostly object handles; entries of the same arity share one tuple.
+_ARGS_EXEC_OBJ3 = (_object_t,) * 3 + (_p_object_t,)
+_ARGS_EXEC_OBJ4 = (_object_t,) * 4 + (_p_object_t,)
+_ARGS_EXEC_OBJ5 = (_object_t,) * 5 + (_p_object_t,)
+_ARGS_EXEC_OBJ6 = (_object_t,) * 6 + (_p_object_t,)
+_ARGS_EXEC_OBJ7 = (_object_t,) * 7 + (_p_object_t,)
+_ARGS_EXEC_OBJ9 = (_object_t,) * 9 + (_p_object_t,)
+
+# Unary, binary and select op getters all share the `() -> spla_Object`
+# shape; their table entries are generated from the op name lists below.
+_UNARY_OPS = (
+    "IDENTITY_INT", "IDENTITY_UINT", "IDENTITY_FLOAT", "AINV_INT",
+    "AINV_UINT", "AINV_FLOAT", "MINV_INT", "MINV_UINT", "MINV_FLOAT",
+    "LNOT_INT", "LNOT_UINT", "LNOT_FLOAT", "UONE_INT", "UONE_UINT",
+    "UONE_FLOAT", "ABS_INT", "ABS_UINT", "ABS_FLOAT", "BNOT_INT", "BNOT_UINT",
+    "SQRT_FLOAT", "LOG_FLOAT", "EXP_FLOAT", "SIN_FLOAT", "COS_FLOAT",
+    "TAN_FLOAT", "ASIN_FLOAT", "ACOS_FLOAT", "ATAN_FLOAT", "CEIL_FLOAT",
+    "FLOOR_FLOAT", "ROUND_FLOAT", "TRUNC_FLOAT",
+)
+
+_BINARY_OPS = (
+    "PLUS_INT", "PLUS_UINT", "PLUS_FLOAT", "MINUS_INT", "MINUS_UINT",
+    "MINUS_FLOAT", "MULT_INT", "MULT_UINT", "MULT_FLOAT", "DIV_INT",
+    "DIV_UINT", "DIV_FLOAT", "MINUS_POW2_INT", "MINUS_POW2_UINT",
+    "MINUS_POW2_FLOAT", "FIRST_INT", "FIRST_UINT", "FIRST_FLOAT",
+    "SECOND_INT", "SECOND_UINT", "SECOND_FLOAT", "BONE_INT", "BONE_UINT",
+    "BONE_FLOAT", "MIN_INT", "MIN_UINT", "MIN_FLOAT", "MAX_INT", "MAX_UINT",
+    "MAX_FLOAT", "LOR_INT", "LOR_UINT", "LOR_FLOAT", "LAND_INT", "LAND_UINT",
+    "LAND_FLOAT", "BOR_INT", "BOR_UINT", "BAND_INT", "BAND_UINT", "BXOR_INT",
+    "BXOR_UINT", "FIRST_NON_MAX_INT", "MIN_NON_MAX_INT", "CONST_MAX_INT",
+    "SECOND_MAX_INT", "MIN_NON_ZERO_INT", "S1ST_IF_SND_MAX_INT",
+    "FST_MINUS_ONE_INT", "SELECT_MIN_WEIGHT_UINT", "CONSTRUCT_PAIR_UINT",
+)
+
+_SELECT_OPS = (
+    "EQZERO_INT", "EQZERO_UINT", "EQZERO_FLOAT", "NQZERO_INT", "NQZERO_UINT",
+    "NQZERO_FLOAT", "GTZERO_INT", "GTZERO_UINT", "GTZERO_FLOAT", "GEZERO_INT",
+    "GEZERO_UINT", "GEZERO_FLOAT", "LTZERO_INT", "LTZERO_UINT",
+    "LTZERO_FLOAT", "LEZERO_INT", "LEZERO_UINT", "LEZERO_FLOAT", "ALWAYS_INT",
+    "ALWAYS_UINT", "ALWAYS_FLOAT", "NEVER_INT", "NEVER_UINT", "NEVER_FLOAT",
+    "EQUALS_MINF_FLOAT", "EQUALS_MAX_INT", "EQUALS_MAX_UINT",
+    "NEQUALS_MAX_INT", "NEQUALS_MAX_UINT",
+)
+
+# Table of (name, restype, argtypes) records for every C entry point of
+# the library. Prototypes are applied in a single loop in `load_library`.
+_PROTOS = [
+
+    ("spla_Library_finalize", None, _ARGS_EMPTY),
+    ("spla_Library_initialize", _status_t, _ARGS_EMPTY),
+    ("spla_Library_set_accelerator", _status_t, (_enum_t,)),
+    ("spla_Library_set_platform", _status_t, (_int,)),
+    ("spla_Library_set_device", _status_t, (_int,)),
+    ("spla_Library_set_queues_count", _status_t, (_int,)),
+    ("spla_Library_set_message_callback", _status_t, (_callback_t, ctypes.c_void_p)),
+    ("spla_Library_set_default_callback", _status_t, _ARGS_EMPTY),
+    ("spla_Library_get_accelerator_info", _status_t, (ctypes.c_char_p, _int)),
+    ("spla_Type_BOOL", _RET_OBJ, _ARGS_EMPTY),
+    ("spla_Type_INT", _RET_OBJ, _ARGS_EMPTY),
+    ("spla_Type_UINT", _RET_OBJ, _ARGS_EMPTY),
+    ("spla_Type_FLOAT", _RET_OBJ, _ARGS_EMPTY),
+    ("spla_RefCnt_ref", _status_t, _ARGS_OBJ),
+    ("spla_RefCnt_unref", _status_t, _ARGS_OBJ),
+    ("spla_MemView_make", _status_t, (_p_object_t, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int)),
+    ("spla_MemView_read", _status_t, (_object_t, ctypes.c_size_t, ctypes.c_size_t, ctypes.c_void_p)),
+    ("spla_MemView_write", _status_t, (_object_t, ctypes.c_size_t, ctypes.c_size_t, ctypes.c_void_p)),
+    ("spla_MemView_get_buffer", _status_t, (_object_t, _p_void_p)),
+    ("spla_MemView_get_size", _status_t, (_object_t, _p_size_t)),
+    ("spla_MemView_is_mutable", _status_t, (_object_t, _p_int)),
+    ("spla_Scalar_make", _status_t, (_p_object_t, _object_t)),
+    ("spla_Scalar_set_int", _status_t, (_object_t, _int)),
+    ("spla_Scalar_set_uint", _status_t, (_object_t, _uint)),
+    ("spla_Scalar_set_float", _status_t, (_object_t, _float)),
+    ("spla_Scalar_get_int", _status_t, (_object_t, _p_int)),
+    ("spla_Scalar_get_uint", _status_t, (_object_t, _p_uint)),
+    ("spla_Scalar_get_float", _status_t, (_object_t, _p_float)),
+    ("spla_Array_make", _status_t, (_p_object_t, _uint, _object_t)),
+    ("spla_Array_get_n_values", _status_t, (_object_t, _p_uint)),
+    ("spla_Array_set_int", _status_t, (_object_t, _uint, _int)),
+    ("spla_Array_set_uint", _status_t, (_object_t, _uint, _uint)),
+    ("spla_Array_set_float", _status_t, (_object_t, _uint, _float)),
+    ("spla_Array_get_int", _status_t, (_object_t, _uint, _p_int)),
+    ("spla_Array_get_uint", _status_t, (_object_t, _uint, _p_uint)),
+    ("spla_Array_get_float", _status_t, (_object_t, _uint, _p_float)),
+    ("spla_Array_resize", _status_t, (_object_t, _uint)),
+    ("spla_Array_build", _status_t, (_object_t, _object_t)),
+    ("spla_Array_read", _status_t, (_object_t, _p_object_t)),
+    ("spla_Array_clear", _status_t, _ARGS_OBJ),
+    ("spla_Vector_make", _status_t, (_p_object_t, _uint, _object_t)),
+    ("spla_Vector_set_format", _status_t, (_object_t, ctypes.c_int)),
+    ("spla_Vector_set_fill_value", _status_t, (_object_t, _object_t)),
+    ("spla_Vector_set_reduce", _status_t, (_object_t, _object_t)),
+    ("spla_Vector_set_int", _status_t, (_object_t, _uint, _int)),
+    ("spla_Vector_set_uint", _status_t, (_object_t, _uint, _uint)),
+    ("spla_Vector_set_float", _status_t, (_object_t, _uint, _float)),
+    ("spla_Vector_get_int", _status_t, (_object_t, _uint, _p_int)),
+    ("spla_Vector_get_uint", _status_t, (_object_t, _uint, _p_uint)),
+    ("spla_Vector_get_float", _status_t, (_object_t, _uint, _p_float)),
+    ("spla_Vector_build", _status_t, (_object_t, _object_t, _object_t)),
+    ("spla_Vector_read", _status_t, (_object_t, _p_object_t, _p_object_t)),
+    ("spla_Vector_clear", _status_t, _ARGS_OBJ),
+    ("spla_Matrix_make", _status_t, (_p_object_t, _uint, _uint, _object_t)),
+    ("spla_Matrix_set_format", _status_t, (_object_t, ctypes.c_int)),
+    ("spla_Matrix_set_fill_value", _status_t, (_object_t, _object_t)),
+    ("spla_Matrix_set_reduce", _status_t, (_object_t, _object_t)),
+    ("spla_Matrix_set_int", _status_t, (_object_t, _uint, _uint, _int)),
+    ("spla_Matrix_set_uint", _status_t, (_object_t, _uint, _uint, _uint)),
+    ("spla_Matrix_set_float", _status_t, (_object_t, _uint, _uint, _float)),
+    ("spla_Matrix_get_int", _status_t, (_object_t, _uint, _uint, _p_int)),
+    ("spla_Matrix_get_uint", _status_t, (_object_t, _uint, _uint, _p_uint)),
+    ("spla_Matrix_get_float", _status_t, (_object_t, _uint, _uint, _p_float)),
+    ("spla_Matrix_build", _status_t, (_object_t, _object_t, _object_t, _object_t)),
+    ("spla_Matrix_read", _status_t, (_object_t, _p_object_t, _p_object_t, _p_object_t)),
+    ("spla_Matrix_clear", _status_t, _ARGS_OBJ),
+    ("spla_Algorithm_bfs", _status_t, (_object_t, _object_t, _uint, _object_t)),
+    ("spla_Algorithm_sssp", _status_t, (_object_t, _object_t, _uint, _object_t)),
+    ("spla_Algorithm_pr", _status_t, (_p_object_t, _object_t, _float, _float, _object_t)),
+    ("spla_Algorithm_tc", _status_t, (_p_int, _object_t, _object_t, _object_t)),
+    # Each Exec call crosses the FFI boundary separately. Batching several
+    # ops into one crossing needs a command-buffer entry point in the C ABI;
+    # the header only typedefs spla_Schedule/spla_ScheduleTask and exports no
+    # functions over them yet, so the trailing task out-param is always null
+    # and chains cannot be fused from this side of the boundary.
+    ("spla_Exec_mxm", _status_t, _ARGS_EXEC_OBJ7),
+    ("spla_Exec_mxmT_masked", _status_t, _ARGS_EXEC_OBJ9),
+    ("spla_Exec_kron", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_mxv_masked", _status_t, _ARGS_EXEC_OBJ9),
+    ("spla_Exec_vxm_masked", _status_t, _ARGS_EXEC_OBJ9),
+    ("spla_Exec_m_eadd", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_m_emult", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_m_reduce_by_row", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_m_reduce_by_column", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_m_reduce", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_m_transpose", _status_t, _ARGS_EXEC_OBJ4),
+    ("spla_Exec_m_extract_row", _status_t, (_object_t, _object_t, _uint, _object_t, _object_t, _p_object_t)),
+    ("spla_Exec_m_extract_column", _status_t, (_object_t, _object_t, _uint, _object_t, _object_t, _p_object_t)),
+    ("spla_Exec_v_eadd", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_v_emult", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_v_eadd_fdb", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_v_assign_masked", _status_t, _ARGS_EXEC_OBJ6),
+    ("spla_Exec_v_map", _status_t, _ARGS_EXEC_OBJ4),
+    ("spla_Exec_v_reduce", _status_t, _ARGS_EXEC_OBJ5),
+    ("spla_Exec_v_count_mf", _status_t, _ARGS_EXEC_OBJ3),
+]
+
+for _name in _UNARY_OPS:
+    _PROTOS.append(("spla_OpUnary_" + _name, _RET_OBJ, _ARGS_EMPTY))
+for _name in _BINARY_OPS:
+    _PROTOS.append(("spla_OpBinary_" + _name, _RET_OBJ, _ARGS_EMPTY))
+for _name in _SELECT_OPS:
+    _PROTOS.append(("spla_OpSelect_" + _name, _RET_OBJ, _ARGS_EMPTY))
+
+
+
+# Function pointer types shared per signature; building one CFUNCTYPE per
+# bound function would create hundreds of identical ctypes types.
+_functypes = {}
+
+
+def _functype(restype, argtypes):
+    key = (restype, argtypes)
+    functype = _functypes.get(key)
+    if functype is None:
+        functype = _functypes[key] = ctypes.CFUNCTYPE(restype, *argtypes)
+    return functype
+
+
+class _LazySpla:
+    """
+    Lazy binding proxy over the loaded C shared library.
+
+    Prototypes from `_PROTOS` are applied on first attribute access and
+    the resulting function is cached, so importing the package does not
+    pay for resolving hundreds of entry points most scripts never call.
+    Accessing a name without a known prototype raises AttributeError,
+    matching the behavior of a plain ctypes library handle.
+
+    Bound functions are plain ctypes foreign functions, so the GIL is
+    released for the duration of every native call. This lets python
+    threads overlap long-running kernels; wrappers must not hold python
+    locks across `spla_Exec_*` calls to preserve that overlap.
+    """
+
+    __slots__ = ("_lib", "_protos", "_cache")
+
+    def __init__(self, lib, protos):
+        self._lib = lib
+        self._protos = protos
+        self._cache = {}
+
+    def __getattr__(self, name):
+        fn = self._cache.get(name)
+        if fn is None:
+            try:
+                restype, argtypes = self._protos[name]
+            except KeyError:
+                raise AttributeError(name) from None
+            try:
+                # Direct function pointers skip the per-call argtypes
+                # bookkeeping of a CDLL attribute
+                fn = _functype(restype, argtypes)((name, self._lib))
+            except AttributeError:
+                raise AttributeError(
+                    f"no symbol `{name}` in loaded library `{self._lib._name}`, "
+                    f"likely an older libspla build"
+                ) from None
+            self._cache[name] = fn
+        return fn
+
 
 def load_library(lib_path):
     global _spla
-    global _int
-    global _enum_t
-    global _status_t
-    global _object_t
-    global _p_object_t
-    global _callback_t
-
-    _spla = ctypes.cdll.LoadLibrary(str(lib_path))
-    _int = ctypes.c_int
-    _uint = ctypes.c_uint
-    _float = ctypes.c_float
-    _p_int = ctypes.POINTER(ctypes.c_int)
-    _p_uint = ctypes.POINTER(ctypes.c_uint)
-    _p_float = ctypes.POINTER(ctypes.c_float)
-    _enum_t = ctypes.c_uint
-    _status_t = ctypes.c_uint
-    _object_t = ctypes.c_void_p
-    _p_object_t = ctypes.POINTER(_object_t)
-    _callback_t = ctypes.CFUNCTYPE(
-        None,
-        ctypes.c_int,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.c_int,
-        ctypes.c_void_p,
+
+    # RTLD_LOCAL keeps library symbols out of the global namespace and
+    # RTLD_LAZY defers symbol relocation until first reference, shortening
+    # startup for a library this large (both are no-ops on windows, where
+    # the flags do not exist); errno bookkeeping is skipped since the
+    # library reports failures through status codes only.
+    mode = getattr(os, "RTLD_LOCAL", 0) | getattr(os, "RTLD_LAZY", 0)
+    lib = ctypes.CDLL(
+        str(lib_path),
+        mode=mode,
+        use_errno=False,
+        use_last_error=False,
     )
+    protos = {name: (restype, argtypes) for name, restype, argtypes in _PROTOS}
+
+    _spla = _LazySpla(lib, protos)
 
-    _spla.spla_Library_finalize.restype = None
-    _spla.spla_Library_finalize.argtypes = []
-    _spla.spla_Library_initialize.restype = _status_t
-    _spla.spla_Library_initialize.argtypes = []
-    _spla.spla_Library_set_accelerator.restype = _status_t
-    _spla.spla_Library_set_accelerator.argtypes = [_enum_t]
-    _spla.spla_Library_set_platform.restype = _status_t
-    _spla.spla_Library_set_platform.argtypes = [_int]
-    _spla.spla_Library_set_device.restype = _status_t
-    _spla.spla_Library_set_device.argtypes = [_int]
-    _spla.spla_Library_set_queues_count.restype = _status_t
-    _spla.spla_Library_set_queues_count.argtypes = [_int]
-    _spla.spla_Library_set_message_callback.restype = _status_t
-    _spla.spla_Library_set_message_callback.argtypes = [_callback_t, ctypes.c_void_p]
-    _spla.spla_Library_set_default_callback.restype = _status_t
-    _spla.spla_Library_set_default_callback.argtypes = []
-    _spla.spla_Library_get_accelerator_info.restype = _status_t
-    _spla.spla_Library_get_accelerator_info.argtypes = [ctypes.c_char_p, _int]
-
-    _spla.spla_Type_BOOL.restype = _object_t
-    _spla.spla_Type_BOOL.argtypes = []
-    _spla.spla_Type_INT.restype = _object_t
-    _spla.spla_Type_INT.argtypes = []
-    _spla.spla_Type_UINT.restype = _object_t
-    _spla.spla_Type_UINT.argtypes = []
-    _spla.spla_Type_FLOAT.restype = _object_t
-    _spla.spla_Type_FLOAT.argtypes = []
-
-    _spla.spla_OpUnary_IDENTITY_INT.restype = _object_t
-    _spla.spla_OpUnary_IDENTITY_UINT.restype = _object_t
-    _spla.spla_OpUnary_IDENTITY_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_AINV_INT.restype = _object_t
-    _spla.spla_OpUnary_AINV_UINT.restype = _object_t
-    _spla.spla_OpUnary_AINV_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_MINV_INT.restype = _object_t
-    _spla.spla_OpUnary_MINV_UINT.restype = _object_t
-    _spla.spla_OpUnary_MINV_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_LNOT_INT.restype = _object_t
-    _spla.spla_OpUnary_LNOT_UINT.restype = _object_t
-    _spla.spla_OpUnary_LNOT_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_UONE_INT.restype = _object_t
-    _spla.spla_OpUnary_UONE_UINT.restype = _object_t
-    _spla.spla_OpUnary_UONE_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_ABS_INT.restype = _object_t
-    _spla.spla_OpUnary_ABS_UINT.restype = _object_t
-    _spla.spla_OpUnary_ABS_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_BNOT_INT.restype = _object_t
-    _spla.spla_OpUnary_BNOT_UINT.restype = _object_t
-    _spla.spla_OpUnary_SQRT_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_LOG_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_EXP_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_SIN_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_COS_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_TAN_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_ASIN_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_ACOS_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_ATAN_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_CEIL_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_FLOOR_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_ROUND_FLOAT.restype = _object_t
-    _spla.spla_OpUnary_TRUNC_FLOAT.restype = _object_t
-
-    _spla.spla_OpUnary_IDENTITY_INT.argtypes = []
-    _spla.spla_OpUnary_IDENTITY_UINT.argtypes = []
-    _spla.spla_OpUnary_IDENTITY_FLOAT.argtypes = []
-    _spla.spla_OpUnary_AINV_INT.argtypes = []
-    _spla.spla_OpUnary_AINV_UINT.argtypes = []
-    _spla.spla_OpUnary_AINV_FLOAT.argtypes = []
-    _spla.spla_OpUnary_MINV_INT.argtypes = []
-    _spla.spla_OpUnary_MINV_UINT.argtypes = []
-    _spla.spla_OpUnary_MINV_FLOAT.argtypes = []
-    _spla.spla_OpUnary_LNOT_INT.argtypes = []
-    _spla.spla_OpUnary_LNOT_UINT.argtypes = []
-    _spla.spla_OpUnary_LNOT_FLOAT.argtypes = []
-    _spla.spla_OpUnary_UONE_INT.argtypes = []
-    _spla.spla_OpUnary_UONE_UINT.argtypes = []
-    _spla.spla_OpUnary_UONE_FLOAT.argtypes = []
-    _spla.spla_OpUnary_ABS_INT.argtypes = []
-    _spla.spla_OpUnary_ABS_UINT.argtypes = []
-    _spla.spla_OpUnary_ABS_FLOAT.argtypes = []
-    _spla.spla_OpUnary_BNOT_INT.argtypes = []
-    _spla.spla_OpUnary_BNOT_UINT.argtypes = []
-    _spla.spla_OpUnary_SQRT_FLOAT.argtypes = []
-    _spla.spla_OpUnary_LOG_FLOAT.argtypes = []
-    _spla.spla_OpUnary_EXP_FLOAT.argtypes = []
-    _spla.spla_OpUnary_SIN_FLOAT.argtypes = []
-    _spla.spla_OpUnary_COS_FLOAT.argtypes = []
-    _spla.spla_OpUnary_TAN_FLOAT.argtypes = []
-    _spla.spla_OpUnary_ASIN_FLOAT.argtypes = []
-    _spla.spla_OpUnary_ACOS_FLOAT.argtypes = []
-    _spla.spla_OpUnary_ATAN_FLOAT.argtypes = []
-    _spla.spla_OpUnary_CEIL_FLOAT.argtypes = []
-    _spla.spla_OpUnary_FLOOR_FLOAT.argtypes = []
-    _spla.spla_OpUnary_ROUND_FLOAT.argtypes = []
-    _spla.spla_OpUnary_TRUNC_FLOAT.argtypes = []
-
-    _spla.spla_OpBinary_PLUS_INT.restype = _object_t
-    _spla.spla_OpBinary_PLUS_UINT.restype = _object_t
-    _spla.spla_OpBinary_PLUS_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_MINUS_INT.restype = _object_t
-    _spla.spla_OpBinary_MINUS_UINT.restype = _object_t
-    _spla.spla_OpBinary_MINUS_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_MULT_INT.restype = _object_t
-    _spla.spla_OpBinary_MULT_UINT.restype = _object_t
-    _spla.spla_OpBinary_MULT_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_DIV_INT.restype = _object_t
-    _spla.spla_OpBinary_DIV_UINT.restype = _object_t
-    _spla.spla_OpBinary_DIV_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_MINUS_POW2_INT.restype = _object_t
-    _spla.spla_OpBinary_MINUS_POW2_UINT.restype = _object_t
-    _spla.spla_OpBinary_MINUS_POW2_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_FIRST_INT.restype = _object_t
-    _spla.spla_OpBinary_FIRST_UINT.restype = _object_t
-    _spla.spla_OpBinary_FIRST_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_SECOND_INT.restype = _object_t
-    _spla.spla_OpBinary_SECOND_UINT.restype = _object_t
-    _spla.spla_OpBinary_SECOND_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_BONE_INT.restype = _object_t
-    _spla.spla_OpBinary_BONE_UINT.restype = _object_t
-    _spla.spla_OpBinary_BONE_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_MIN_INT.restype = _object_t
-    _spla.spla_OpBinary_MIN_UINT.restype = _object_t
-    _spla.spla_OpBinary_MIN_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_MAX_INT.restype = _object_t
-    _spla.spla_OpBinary_MAX_UINT.restype = _object_t
-    _spla.spla_OpBinary_MAX_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_LOR_INT.restype = _object_t
-    _spla.spla_OpBinary_LOR_UINT.restype = _object_t
-    _spla.spla_OpBinary_LOR_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_LAND_INT.restype = _object_t
-    _spla.spla_OpBinary_LAND_UINT.restype = _object_t
-    _spla.spla_OpBinary_LAND_FLOAT.restype = _object_t
-    _spla.spla_OpBinary_BOR_INT.restype = _object_t
-    _spla.spla_OpBinary_BOR_UINT.restype = _object_t
-    _spla.spla_OpBinary_BAND_INT.restype = _object_t
-    _spla.spla_OpBinary_BAND_UINT.restype = _object_t
-    _spla.spla_OpBinary_BXOR_INT.restype = _object_t
-    _spla.spla_OpBinary_BXOR_UINT.restype = _object_t
-
-    _spla.spla_OpBinary_FIRST_NON_MAX_INT.restype = _object_t
-    _spla.spla_OpBinary_MIN_NON_MAX_INT.restype = _object_t
-    _spla.spla_OpBinary_CONST_MAX_INT.restype = _object_t
-    _spla.spla_OpBinary_SECOND_MAX_INT.restype = _object_t
-    _spla.spla_OpBinary_MIN_NON_ZERO_INT.restype = _object_t
-    _spla.spla_OpBinary_S1ST_IF_SND_MAX_INT.restype = _object_t
-    _spla.spla_OpBinary_FST_MINUS_ONE_INT.restype = _object_t
-    _spla.spla_OpBinary_SELECT_MIN_WEIGHT_UINT.restype = _object_t
-    _spla.spla_OpBinary_CONSTRUCT_PAIR_UINT.restype = _object_t
-
-    _spla.spla_OpBinary_PLUS_INT.argtypes = []
-    _spla.spla_OpBinary_PLUS_UINT.argtypes = []
-    _spla.spla_OpBinary_PLUS_FLOAT.argtypes = []
-    _spla.spla_OpBinary_MINUS_INT.argtypes = []
-    _spla.spla_OpBinary_MINUS_UINT.argtypes = []
-    _spla.spla_OpBinary_MINUS_FLOAT.argtypes = []
-    _spla.spla_OpBinary_MULT_INT.argtypes = []
-    _spla.spla_OpBinary_MULT_UINT.argtypes = []
-    _spla.spla_OpBinary_MULT_FLOAT.argtypes = []
-    _spla.spla_OpBinary_DIV_INT.argtypes = []
-    _spla.spla_OpBinary_DIV_UINT.argtypes = []
-    _spla.spla_OpBinary_DIV_FLOAT.argtypes = []
-    _spla.spla_OpBinary_MINUS_POW2_INT.argtypes = []
-    _spla.spla_OpBinary_MINUS_POW2_UINT.argtypes = []
-    _spla.spla_OpBinary_MINUS_POW2_FLOAT.argtypes = []
-    _spla.spla_OpBinary_FIRST_INT.argtypes = []
-    _spla.spla_OpBinary_FIRST_UINT.argtypes = []
-    _spla.spla_OpBinary_FIRST_FLOAT.argtypes = []
-    _spla.spla_OpBinary_SECOND_INT.argtypes = []
-    _spla.spla_OpBinary_SECOND_UINT.argtypes = []
-    _spla.spla_OpBinary_SECOND_FLOAT.argtypes = []
-    _spla.spla_OpBinary_BONE_INT.argtypes = []
-    _spla.spla_OpBinary_BONE_UINT.argtypes = []
-    _spla.spla_OpBinary_BONE_FLOAT.argtypes = []
-    _spla.spla_OpBinary_MIN_INT.argtypes = []
-    _spla.spla_OpBinary_MIN_UINT.argtypes = []
-    _spla.spla_OpBinary_MIN_FLOAT.argtypes = []
-    _spla.spla_OpBinary_MAX_INT.argtypes = []
-    _spla.spla_OpBinary_MAX_UINT.argtypes = []
-    _spla.spla_OpBinary_MAX_FLOAT.argtypes = []
-    _spla.spla_OpBinary_LOR_INT.argtypes = []
-    _spla.spla_OpBinary_LOR_UINT.argtypes = []
-    _spla.spla_OpBinary_LOR_FLOAT.argtypes = []
-    _spla.spla_OpBinary_LAND_INT.argtypes = []
-    _spla.spla_OpBinary_LAND_UINT.argtypes = []
-    _spla.spla_OpBinary_LAND_FLOAT.argtypes = []
-    _spla.spla_OpBinary_BOR_INT.argtypes = []
-    _spla.spla_OpBinary_BOR_UINT.argtypes = []
-    _spla.spla_OpBinary_BAND_INT.argtypes = []
-    _spla.spla_OpBinary_BAND_UINT.argtypes = []
-    _spla.spla_OpBinary_BXOR_INT.argtypes = []
-    _spla.spla_OpBinary_BXOR_UINT.argtypes = []
-
-    _spla.spla_OpBinary_FIRST_NON_MAX_INT.argtypes = []
-    _spla.spla_OpBinary_MIN_NON_MAX_INT.argtypes = []
-    _spla.spla_OpBinary_CONST_MAX_INT.argtypes = []
-    _spla.spla_OpBinary_SECOND_MAX_INT.argtypes = []
-    _spla.spla_OpBinary_MIN_NON_ZERO_INT.argtypes = []
-    _spla.spla_OpBinary_S1ST_IF_SND_MAX_INT.argtypes = []
-    _spla.spla_OpBinary_FST_MINUS_ONE_INT.argtypes = []
-    _spla.spla_OpBinary_SELECT_MIN_WEIGHT_UINT.argtypes = []
-    _spla.spla_OpBinary_CONSTRUCT_PAIR_UINT.argtypes = []
-
-    _spla.spla_OpSelect_EQZERO_INT.restype = _object_t
-    _spla.spla_OpSelect_EQZERO_UINT.restype = _object_t
-    _spla.spla_OpSelect_EQZERO_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_NQZERO_INT.restype = _object_t
-    _spla.spla_OpSelect_NQZERO_UINT.restype = _object_t
-    _spla.spla_OpSelect_NQZERO_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_GTZERO_INT.restype = _object_t
-    _spla.spla_OpSelect_GTZERO_UINT.restype = _object_t
-    _spla.spla_OpSelect_GTZERO_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_GEZERO_INT.restype = _object_t
-    _spla.spla_OpSelect_GEZERO_UINT.restype = _object_t
-    _spla.spla_OpSelect_GEZERO_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_LTZERO_INT.restype = _object_t
-    _spla.spla_OpSelect_LTZERO_UINT.restype = _object_t
-    _spla.spla_OpSelect_LTZERO_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_LEZERO_INT.restype = _object_t
-    _spla.spla_OpSelect_LEZERO_UINT.restype = _object_t
-    _spla.spla_OpSelect_LEZERO_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_ALWAYS_INT.restype = _object_t
-    _spla.spla_OpSelect_ALWAYS_UINT.restype = _object_t
-    _spla.spla_OpSelect_ALWAYS_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_NEVER_INT.restype = _object_t
-    _spla.spla_OpSelect_NEVER_UINT.restype = _object_t
-    _spla.spla_OpSelect_NEVER_FLOAT.restype = _object_t
-
-    _spla.spla_OpSelect_EQUALS_MINF_FLOAT.restype = _object_t
-    _spla.spla_OpSelect_EQUALS_MAX_INT.restype = _object_t
-    _spla.spla_OpSelect_EQUALS_MAX_UINT.restype = _object_t
-    _spla.spla_OpSelect_NEQUALS_MAX_INT.restype = _object_t
-    _spla.spla_OpSelect_NEQUALS_MAX_UINT.restype = _object_t
-
-    _spla.spla_OpSelect_EQZERO_INT.argtypes = []
-    _spla.spla_OpSelect_EQZERO_UINT.argtypes = []
-    _spla.spla_OpSelect_EQZERO_FLOAT.argtypes = []
-    _spla.spla_OpSelect_NQZERO_INT.argtypes = []
-    _spla.spla_OpSelect_NQZERO_UINT.argtypes = []
-    _spla.spla_OpSelect_NQZERO_FLOAT.argtypes = []
-    _spla.spla_OpSelect_GTZERO_INT.argtypes = []
-    _spla.spla_OpSelect_GTZERO_UINT.argtypes = []
-    _spla.spla_OpSelect_GTZERO_FLOAT.argtypes = []
-    _spla.spla_OpSelect_GEZERO_INT.argtypes = []
-    _spla.spla_OpSelect_GEZERO_UINT.argtypes = []
-    _spla.spla_OpSelect_GEZERO_FLOAT.argtypes = []
-    _spla.spla_OpSelect_LTZERO_INT.argtypes = []
-    _spla.spla_OpSelect_LTZERO_UINT.argtypes = []
-    _spla.spla_OpSelect_LTZERO_FLOAT.argtypes = []
-    _spla.spla_OpSelect_LEZERO_INT.argtypes = []
-    _spla.spla_OpSelect_LEZERO_UINT.argtypes = []
-    _spla.spla_OpSelect_LEZERO_FLOAT.argtypes = []
-    _spla.spla_OpSelect_ALWAYS_INT.argtypes = []
-    _spla.spla_OpSelect_ALWAYS_UINT.argtypes = []
-    _spla.spla_OpSelect_ALWAYS_FLOAT.argtypes = []
-    _spla.spla_OpSelect_NEVER_INT.argtypes = []
-    _spla.spla_OpSelect_NEVER_UINT.argtypes = []
-    _spla.spla_OpSelect_NEVER_FLOAT.argtypes = []
-
-    _spla.spla_OpSelect_EQUALS_MINF_FLOAT.argtypes = []
-    _spla.spla_OpSelect_EQUALS_MAX_INT.argtypes = []
-    _spla.spla_OpSelect_EQUALS_MAX_UINT.argtypes = []
-    _spla.spla_OpSelect_NEQUALS_MAX_INT.argtypes = []
-    _spla.spla_OpSelect_NEQUALS_MAX_UINT.argtypes = []
-
-    _spla.spla_RefCnt_ref.restype = _status_t
-    _spla.spla_RefCnt_unref.restype = _status_t
-
-    _spla.spla_RefCnt_ref.argtypes = [_object_t]
-    _spla.spla_RefCnt_unref.argtypes = [_object_t]
-
-    _spla.spla_MemView_make.restype = _status_t
-    _spla.spla_MemView_read.restype = _status_t
-    _spla.spla_MemView_write.restype = _status_t
-    _spla.spla_MemView_get_buffer.restype = _status_t
-    _spla.spla_MemView_get_size.restype = _status_t
-    _spla.spla_MemView_is_mutable.restype = _status_t
-
-    _spla.spla_MemView_make.argtypes = [
-        _p_object_t,
-        ctypes.c_void_p,
-        ctypes.c_size_t,
-        ctypes.c_int,
-    ]
-    _spla.spla_MemView_read.argtypes = [
-        _object_t,
-        ctypes.c_size_t,
-        ctypes.c_size_t,
-        ctypes.c_void_p,
-    ]
-    _spla.spla_MemView_write.argtypes = [
-        _object_t,
-        ctypes.c_size_t,
-        ctypes.c_size_t,
-        ctypes.c_void_p,
-    ]
-    _spla.spla_MemView_get_buffer.argtypes = [
-        _object_t,
-        ctypes.POINTER(ctypes.c_void_p),
-    ]
-    _spla.spla_MemView_get_size.argtypes = [_object_t, ctypes.POINTER(ctypes.c_size_t)]
-    _spla.spla_MemView_is_mutable.argtypes = [_object_t, ctypes.POINTER(ctypes.c_int)]
-
-    _spla.spla_Scalar_make.restype = _status_t
-    _spla.spla_Scalar_set_int.restype = _status_t
-    _spla.spla_Scalar_set_uint.restype = _status_t
-    _spla.spla_Scalar_set_float.restype = _status_t
-    _spla.spla_Scalar_get_int.restype = _status_t
-    _spla.spla_Scalar_get_uint.restype = _status_t
-    _spla.spla_Scalar_get_float.restype = _status_t
-
-    _spla.spla_Scalar_make.argtypes = [_p_object_t, _object_t]
-    _spla.spla_Scalar_set_int.argtypes = [_object_t, _int]
-    _spla.spla_Scalar_set_uint.argtypes = [_object_t, _uint]
-    _spla.spla_Scalar_set_float.argtypes = [_object_t, _float]
-    _spla.spla_Scalar_get_int.argtypes = [_object_t, _p_int]
-    _spla.spla_Scalar_get_uint.argtypes = [_object_t, _p_uint]
-    _spla.spla_Scalar_get_float.argtypes = [_object_t, _p_float]
-
-    _spla.spla_Array_make.restype = _status_t
-    _spla.spla_Array_get_n_values.restype = _status_t
-    _spla.spla_Array_set_int.restype = _status_t
-    _spla.spla_Array_set_uint.restype = _status_t
-    _spla.spla_Array_set_float.restype = _status_t
-    _spla.spla_Array_get_int.restype = _status_t
-    _spla.spla_Array_get_uint.restype = _status_t
-    _spla.spla_Array_get_float.restype = _status_t
-    _spla.spla_Array_resize.restype = _status_t
-    _spla.spla_Array_build.restype = _status_t
-    _spla.spla_Array_read.restype = _status_t
-    _spla.spla_Array_clear.restype = _status_t
-
-    _spla.spla_Array_make.argtypes = [_p_object_t, _uint, _object_t]
-    _spla.spla_Array_get_n_values.argtypes = [_object_t, _p_uint]
-    _spla.spla_Array_set_int.argtypes = [_object_t, _uint, _int]
-    _spla.spla_Array_set_uint.argtypes = [_object_t, _uint, _uint]
-    _spla.spla_Array_set_float.argtypes = [_object_t, _uint, _float]
-    _spla.spla_Array_get_int.argtypes = [_object_t, _uint, _p_int]
-    _spla.spla_Array_get_uint.argtypes = [_object_t, _uint, _p_uint]
-    _spla.spla_Array_get_float.argtypes = [_object_t, _uint, _p_float]
-    _spla.spla_Array_resize.argtypes = [_object_t, _uint]
-    _spla.spla_Array_build.argtypes = [_object_t, _object_t]
-    _spla.spla_Array_read.argtypes = [_object_t, _p_object_t]
-    _spla.spla_Array_clear.argtypes = [_object_t]
-
-    _spla.spla_Vector_make.restype = _status_t
-    _spla.spla_Vector_set_format.restype = _status_t
-    _spla.spla_Vector_set_fill_value.restype = _status_t
-    _spla.spla_Vector_set_reduce.restype = _status_t
-    _spla.spla_Vector_set_int.restype = _status_t
-    _spla.spla_Vector_set_uint.restype = _status_t
-    _spla.spla_Vector_set_float.restype = _status_t
-    _spla.spla_Vector_get_int.restype = _status_t
-    _spla.spla_Vector_get_uint.restype = _status_t
-    _spla.spla_Vector_get_float.restype = _status_t
-    _spla.spla_Vector_build.restype = _status_t
-    _spla.spla_Vector_read.restype = _status_t
-    _spla.spla_Vector_clear.restype = _status_t
-
-    _spla.spla_Vector_make.argtypes = [_p_object_t, _uint, _object_t]
-    _spla.spla_Vector_set_format.argtypes = [_object_t, ctypes.c_int]
-    _spla.spla_Vector_set_fill_value.argtypes = [_object_t, _object_t]
-    _spla.spla_Vector_set_reduce.argtypes = [_object_t, _object_t]
-    _spla.spla_Vector_set_int.argtypes = [_object_t, _uint, _int]
-    _spla.spla_Vector_set_uint.argtypes = [_object_t, _uint, _uint]
-    _spla.spla_Vector_set_float.argtypes = [_object_t, _uint, _float]
-    _spla.spla_Vector_get_int.argtypes = [_object_t, _uint, _p_int]
-    _spla.spla_Vector_get_uint.argtypes = [_object_t, _uint, _p_uint]
-    _spla.spla_Vector_get_float.argtypes = [_object_t, _uint, _p_float]
-    _spla.spla_Vector_build.argtypes = [_object_t, _object_t, _object_t]
-    _spla.spla_Vector_read.argtypes = [_object_t, _p_object_t, _p_object_t]
-    _spla.spla_Vector_clear.argtypes = [_object_t]
-
-    _spla.spla_Matrix_make.restype = _status_t
-    _spla.spla_Matrix_set_format.restype = _status_t
-    _spla.spla_Matrix_set_fill_value.restype = _status_t
-    _spla.spla_Matrix_set_reduce.restype = _status_t
-    _spla.spla_Matrix_set_int.restype = _status_t
-    _spla.spla_Matrix_set_uint.restype = _status_t
-    _spla.spla_Matrix_set_float.restype = _status_t
-    _spla.spla_Matrix_get_int.restype = _status_t
-    _spla.spla_Matrix_get_uint.restype = _status_t
-    _spla.spla_Matrix_get_float.restype = _status_t
-    _spla.spla_Matrix_build.restype = _status_t
-    _spla.spla_Matrix_read.restype = _status_t
-    _spla.spla_Matrix_clear.restype = _status_t
-
-    _spla.spla_Matrix_make.argtypes = [_p_object_t, _uint, _uint, _object_t]
-    _spla.spla_Matrix_set_format.argtypes = [_object_t, ctypes.c_int]
-    _spla.spla_Matrix_set_fill_value.argtypes = [_object_t, _object_t]
-    _spla.spla_Matrix_set_reduce.argtypes = [_object_t, _object_t]
-    _spla.spla_Matrix_set_int.argtypes = [_object_t, _uint, _uint, _int]
-    _spla.spla_Matrix_set_uint.argtypes = [_object_t, _uint, _uint, _uint]
-    _spla.spla_Matrix_set_float.argtypes = [_object_t, _uint, _uint, _float]
-    _spla.spla_Matrix_get_int.argtypes = [_object_t, _uint, _uint, _p_int]
-    _spla.spla_Matrix_get_uint.argtypes = [_object_t, _uint, _uint, _p_uint]
-    _spla.spla_Matrix_get_float.argtypes = [_object_t, _uint, _uint, _p_float]
-    _spla.spla_Matrix_build.argtypes = [_object_t, _object_t, _object_t, _object_t]
-    _spla.spla_Matrix_read.argtypes = [_object_t, _p_object_t, _p_object_t, _p_object_t]
-    _spla.spla_Matrix_clear.argtypes = [_object_t]
-
-    _spla.spla_Algorithm_bfs.restype = _status_t
-    _spla.spla_Algorithm_sssp.restype = _status_t
-    _spla.spla_Algorithm_pr.restype = _status_t
-    _spla.spla_Algorithm_tc.restype = _status_t
-
-    _spla.spla_Algorithm_bfs.argtypes = [_object_t, _object_t, _uint, _object_t]
-    _spla.spla_Algorithm_sssp.argtypes = [_object_t, _object_t, _uint, _object_t]
-    _spla.spla_Algorithm_pr.argtypes = [
-        _p_object_t,
-        _object_t,
-        _float,
-        _float,
-        _object_t,
-    ]
-    _spla.spla_Algorithm_tc.argtypes = [_p_int, _object_t, _object_t, _object_t]
-
-    _spla.spla_Exec_mxm.restype = _status_t
-    _spla.spla_Exec_mxmT_masked.restype = _status_t
-    _spla.spla_Exec_kron.restype = _status_t
-    _spla.spla_Exec_mxv_masked.restype = _status_t
-    _spla.spla_Exec_vxm_masked.restype = _status_t
-    _spla.spla_Exec_m_eadd.restype = _status_t
-    _spla.spla_Exec_m_emult.restype = _status_t
-    _spla.spla_Exec_m_reduce_by_row.restype = _status_t
-    _spla.spla_Exec_m_reduce_by_column.restype = _status_t
-    _spla.spla_Exec_m_reduce.restype = _status_t
-    _spla.spla_Exec_m_transpose.restype = _status_t
-    _spla.spla_Exec_m_extract_row.restype = _status_t
-    _spla.spla_Exec_m_extract_column.restype = _status_t
-    _spla.spla_Exec_v_eadd.restype = _status_t
-    _spla.spla_Exec_v_emult.restype = _status_t
-    _spla.spla_Exec_v_eadd_fdb.restype = _status_t
-    _spla.spla_Exec_v_assign_masked.restype = _status_t
-    _spla.spla_Exec_v_map.restype = _status_t
-    _spla.spla_Exec_v_reduce.restype = _status_t
-    _spla.spla_Exec_v_count_mf.restype = _status_t
-
-    _spla.spla_Exec_mxm.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_mxmT_masked.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_kron.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_mxv_masked.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_vxm_masked.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_eadd.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_emult.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_reduce_by_row.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_reduce_by_column.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_reduce.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_transpose.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_extract_row.argtypes = [
-        _object_t,
-        _object_t,
-        _uint,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_m_extract_column.argtypes = [
-        _object_t,
-        _object_t,
-        _uint,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_v_eadd.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_v_emult.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_v_eadd_fdb.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_v_assign_masked.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_v_map.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_v_reduce.argtypes = [
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _object_t,
-        _p_object_t,
-    ]
-    _spla.spla_Exec_v_count_mf.argtypes = [_object_t, _object_t, _object_t, _p_object_t]
+    # Exec entry points sit on the hot path of every operation, so resolve
+    # them eagerly; all other symbols stay lazy until first use.
+    for name in protos:
+        if name.startswith("spla_Exec_"):
+            getattr(_spla, name)
 
 
 def default_callback(status, msg, file, function, line, user_data):
-    decoded_msg = msg.decode("utf-8")
-    decoded_file = file.decode("utf-8")
-    print(f"pyspla: [{decoded_file}:{line}] {_status_mapping[status]}: {decoded_msg}")
+    # The library may emit events in bulk, so the whole message is built
+    # as bytes (no utf-8 decode, no str formatting) and written straight
+    # to the stdout fd, bypassing buffered I/O locking
+    os.write(
+        1,
+        b"pyspla: [" + file + b":" + str(line).encode() + b"] "
+        + _STATUS_BYTES.get(status, b"SplaError") + b": " + msg + b"\n",
+    )
 
 
 def init_library():
@@ -814,45 +506,76 @@ def initialize():
     global _is_docs
     global _spla
     global _spla_path
-    global _callback_t
     global _default_callback
 
-    try:
-        # If generating docs, no lib init required
-        if os.environ["SPLA_DOCS"]:
-            _is_docs = True
-            return
-    except KeyError:
-        pass
+    # If generating docs, no lib init required
+    if os.environ.get("SPLA_DOCS"):
+        _is_docs = True
+        return
 
-    _spla_path = pathlib.Path(__file__).resolve().parent / TARGET
+    target = target_library_name()
+    _spla_path = os.path.join(os.path.dirname(__file__), target)
 
-    try:
-        # Override library path from ENV variable (for debug & custom build)
-        if os.environ["SPLA_PATH"]:
-            _spla_path = pathlib.Path(os.environ["SPLA_PATH"])
-    except KeyError:
-        pass
+    # Override library path from ENV variable (for debug & custom build)
+    env_path = os.environ.get("SPLA_PATH")
+    if env_path:
+        _spla_path = env_path
 
-    if not _spla_path.is_file():
+    if not os.path.isfile(_spla_path):
         # Validate file before loading
-        raise Exception(f"no compiled spla file {TARGET} to load")
+        raise Exception(f"no compiled spla file {target} to load")
 
     load_library(_spla_path)
     init_library()
 
-    _default_callback = _callback_t(default_callback)
+    # If debug enable in ENV, setup default callback for messages on init
+    if int(os.environ.get("SPLA_DEBUG", 0)):
+        if _default_callback is None:
+            # Construct the callback trampoline exactly once and keep the
+            # module reference alive for the GC; non-debug runs never pay
+            # for the libffi closure allocation
+            _default_callback = _callback_t(default_callback)
+        _spla.spla_Library_set_message_callback(
+            _default_callback, ctypes.c_void_p(0)
+        )
+
+    # Only reached when load and init succeeded; failed imports leave no
+    # callback behind to slow interpreter shutdown
+    atexit.register(finalize)
 
-    try:
-        # If debug enable in ENV, setup default callback for messages on init
-        if int(os.environ["SPLA_DEBUG"]):
-            _spla.spla_Library_set_message_callback(
-                _default_callback, ctypes.c_void_p(0)
-            )
-    except KeyError:
-        pass
 
-    atexit.register(finalize)
+def shutdown():
+    """
+    Explicitly finalize the library and drop the interpreter exit hook.
+
+    Short-lived processes (CLI tools, test workers) can call this to
+    release native resources deterministically instead of leaving the
+    atexit callback to run at interpreter shutdown.
+    """
+
+    finalize()
+    atexit.unregister(finalize)
+
+
+@contextlib.contextmanager
+def spla_runtime():
+    """
+    Context manager for a deterministic library lifetime.
+
+    Library is initialized on enter and finalized on exit, so a long-running
+    process can release native resources (accelerator queues, device memory)
+    at a point of its choice instead of waiting for interpreter shutdown.
+    The regular atexit hook is unregistered after the explicit finalize.
+
+    >>> with spla_runtime():
+    >>>     pass  # use library primitives here
+    """
+
+    init_library()
+    try:
+        yield
+    finally:
+        shutdown()
 
 
 def check(status):
@@ -862,8 +585,8 @@ def check(status):
     :param status:
         Status to check.
     """
-    if status != 0:
-        raise _status_mapping[status]
+    if status:
+        raise _STATUS_EXC[status] if status < _STATUS_COUNT else SplaError
 
 
 def is_docs():
@@ -873,7 +596,6 @@ def is_docs():
     :return: True if generating docs.
     """
 
-    global _is_docs
     return _is_docs
 
 
@@ -881,8 +603,25 @@ def backend():
     """
     Access to a loaded compiled C library instance.
 
+    Wrappers issuing many native calls in a tight loop should hoist the
+    result into a local (`b = backend()`) instead of calling the accessor
+    per iteration.
+
     :return: Library with C functions to call or None.
     """
 
-    global _spla
     return _spla
+
+
+def get_accelerator_info():
+    """
+    Query description of a currently used library accelerator.
+
+    :return: String with accelerator info or None if no library loaded.
+    """
+
+    if _spla is None:
+        return None
+
+    check(_spla.spla_Library_get_accelerator_info(_ACCEL_INFO_BUF, _ACCEL_INFO_BUF_SIZE))
+    return _ACCEL_INFO_BUF.value.decode("utf-8")
@@ -38,6 +38,12 @@ from .object import Object
 from .scalar import Scalar
 from .type import FLOAT, INT, UINT, Type
 
+# Shared null handles for Exec calls: a missing descriptor is a null object
+# and the schedule task out-param is always null, so one immutable instance
+# of each serves every call instead of a fresh ctypes object per operation
+_NULL_DESC = ctypes.c_void_p(0)
+_NULL_TASK = ctypes.POINTER(ctypes.c_void_p)()
+
 
 class Matrix(Object):
     """
@@ -204,7 +210,7 @@ class Matrix(Object):
         :param fmt: FormatMatrix.
             One of built-in storage formats to set.
         """
-        check(backend().spla_Matrix_set_format(self.hnd, ctypes.c_int32(fmt.value)))
+        check(backend().spla_Matrix_set_format(self.hnd, fmt))
 
     def _set_fill_value(self, v):
         check(backend().spla_Matrix_set_fill_value(self.hnd, v._hnd))
@@ -502,6 +508,61 @@ class Matrix(Object):
         M.build(view_I, view_J, view_V)
         return M
 
+    @classmethod
+    def from_buffers(
+        cls,
+        I,
+        J,
+        V,
+        shape,
+        format: FormatMatrix = FormatMatrix.CPU_CSR,
+        dtype=INT,
+        zero_v=None,
+    ):
+        """
+        Build matrix from python buffer objects with keys and values to store in matrix.
+        Buffers content is viewed directly without a copy, so building a matrix of
+        millions of entries costs a fixed number of native calls instead of one
+        native call per entry as with incremental `set`.
+
+        Key buffers `I` and `J` must contain row-sorted unsigned 32-bit entries
+        indexing ranges [0, shape-1], values buffer `V` must contain entries with
+        C layout of a `dtype`. Buffers must be C-contiguous. Desired storage
+        `format` is hinted before the build, so row-sorted data lands in the
+        requested layout at once without an extra conversion sweep afterwards.
+
+        :param I: buffer.
+             Buffer with integral row keys of entries.
+
+        :param J: buffer.
+             Buffer with integral column keys of entries.
+
+        :param V: buffer.
+             Buffer with values to store in the matrix.
+
+        :param shape: tuple.
+             Matrix size.
+
+        :param format: optional: FormatMatrix. default: FormatMatrix.CPU_CSR.
+             Storage format to materialize built data in.
+
+        :param dtype:
+             Type of storage parametrization for matrix.
+
+        :return: Created matrix filled with values.
+        """
+
+        assert shape
+        assert shape[0] > 0 and shape[1] > 0
+
+        view_I = MemView.from_buffer(I)
+        view_J = MemView.from_buffer(J)
+        view_V = MemView.from_buffer(V)
+
+        M = Matrix(format=format, shape=shape, dtype=dtype, zero_v=zero_v)
+        M.build(view_I, view_J, view_V)
+        return M
+
     @classmethod
     def rand(cls, shape, dtype=INT, density=0.1, seed=None, dist=(0, 1)):
         """
@@ -1643,7 +1704,7 @@ class Matrix(Object):
         return zip(I, J, V)
 
     def _get_desc(self, desc: Descriptor):
-        return desc.hnd if desc else ctypes.c_void_p(0)
+        return desc.hnd if desc else _NULL_DESC
 
     def _get_task(self, task):
-        return ctypes.POINTER(ctypes.c_void_p)()
+        return _NULL_TASK
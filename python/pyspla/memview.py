@@ -86,6 +86,41 @@ class MemView(Object):
 
         super().__init__(label, hnd)
 
+    @classmethod
+    def from_buffer(cls, buffer, mutable=False, label=None, owner=None):
+        """
+        Creates a new memory view directly over a python buffer object without a copy.
+
+        Buffer must be C-contiguous. Created view retains a reference to the
+        buffer object, so viewed memory stays alive while the view is in use.
+
+        :param buffer: buffer.
+            Object exposing python buffer protocol to view.
+
+        :param mutable: optional: bool. default: False.
+            Optional flag if buffer content is mutable. Requires a writable buffer.
+
+        :param label: optional: str. default: None.
+            MemView name for debugging.
+
+        :param owner: optional: Object. default: None.
+            Optional owner of a given memory view.
+
+        :return: Created memory view over the buffer content.
+        """
+
+        mv = memoryview(buffer)
+        assert mv.c_contiguous
+
+        if mv.readonly:
+            assert not mutable
+            assert isinstance(buffer, bytes)
+            c_buffer = ctypes.cast(ctypes.c_char_p(buffer), ctypes.c_void_p)
+        else:
+            c_buffer = (ctypes.c_char * mv.nbytes).from_buffer(mv)
+
+        return cls(label=label, buffer=c_buffer, size=mv.nbytes, mutable=mutable, owner=owner)
+
     @property
     def buffer(self):
         """
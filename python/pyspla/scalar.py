@@ -194,8 +194,8 @@ class Scalar(Object):
         :return: Value from scalar.
         """
 
-        value = self._dtype._c_type(0)
-        check(self._dtype._scalar_get(self._hnd, ctypes.byref(value)))
+        value, ref = self._dtype._out_cell()
+        check(self._dtype._scalar_get(self._hnd, ref))
         return self._dtype.cast_value(value)
 
     def __str__(self):
@@ -0,0 +1,57 @@
+# Cython declarations for the hot subset of the spla C API.
+#
+# The package itself binds the library through ctypes (see bridge.py for
+# why a compiled extension does not fit the pure-python wheel). This file
+# lets downstream Cython code `cdef extern` the high-traffic entry points
+# and call them without ctypes dispatch when users bring their own build
+# step; it is shipped as data and never compiled by the package.
+
+cdef extern from "spla.h":
+    ctypedef unsigned int spla_uint
+
+    ctypedef enum spla_Status:
+        SPLA_STATUS_OK = 0
+
+    ctypedef struct spla_MemView_t
+    ctypedef struct spla_Descriptor_t
+    ctypedef struct spla_Matrix_t
+    ctypedef struct spla_Vector_t
+    ctypedef struct spla_Scalar_t
+    ctypedef struct spla_ScheduleTask_t
+    ctypedef struct spla_OpUnary_t
+    ctypedef struct spla_OpBinary_t
+    ctypedef struct spla_OpSelect_t
+
+    ctypedef spla_MemView_t* spla_MemView
+    ctypedef spla_Descriptor_t* spla_Descriptor
+    ctypedef spla_Matrix_t* spla_Matrix
+    ctypedef spla_Vector_t* spla_Vector
+    ctypedef spla_Scalar_t* spla_Scalar
+    ctypedef spla_ScheduleTask_t* spla_ScheduleTask
+    ctypedef spla_OpUnary_t* spla_OpUnary
+    ctypedef spla_OpBinary_t* spla_OpBinary
+    ctypedef spla_OpSelect_t* spla_OpSelect
+
+    void        spla_Library_finalize() nogil
+    spla_Status spla_Library_initialize() nogil
+
+    spla_Status spla_Exec_mxm(spla_Matrix R, spla_Matrix A, spla_Matrix B, spla_OpBinary op_multiply, spla_OpBinary op_add, spla_Scalar init, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_mxmT_masked(spla_Matrix R, spla_Matrix mask, spla_Matrix A, spla_Matrix B, spla_OpBinary op_multiply, spla_OpBinary op_add, spla_OpSelect op_select, spla_Scalar init, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_kron(spla_Matrix R, spla_Matrix A, spla_Matrix B, spla_OpBinary op_multiply, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_mxv_masked(spla_Vector r, spla_Vector mask, spla_Matrix M, spla_Vector v, spla_OpBinary op_multiply, spla_OpBinary op_add, spla_OpSelect op_select, spla_Scalar init, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_vxm_masked(spla_Vector r, spla_Vector mask, spla_Vector v, spla_Matrix M, spla_OpBinary op_multiply, spla_OpBinary op_add, spla_OpSelect op_select, spla_Scalar init, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_eadd(spla_Matrix R, spla_Matrix A, spla_Matrix B, spla_OpBinary op, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_emult(spla_Matrix R, spla_Matrix A, spla_Matrix B, spla_OpBinary op, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_reduce_by_row(spla_Vector r, spla_Matrix M, spla_OpBinary op_reduce, spla_Scalar init, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_reduce_by_column(spla_Vector r, spla_Matrix M, spla_OpBinary op_reduce, spla_Scalar init, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_reduce(spla_Scalar r, spla_Scalar s, spla_Matrix M, spla_OpBinary op_reduce, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_transpose(spla_Matrix R, spla_Matrix M, spla_OpUnary op_apply, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_extract_row(spla_Vector r, spla_Matrix M, spla_uint index, spla_OpUnary op_apply, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_m_extract_column(spla_Vector r, spla_Matrix M, spla_uint index, spla_OpUnary op_apply, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_v_eadd(spla_Vector r, spla_Vector u, spla_Vector v, spla_OpBinary op, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_v_emult(spla_Vector r, spla_Vector u, spla_Vector v, spla_OpBinary op, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_v_eadd_fdb(spla_Vector r, spla_Vector v, spla_Vector fdb, spla_OpBinary op, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_v_assign_masked(spla_Vector r, spla_Vector mask, spla_Scalar value, spla_OpBinary op_assign, spla_OpSelect op_select, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_v_map(spla_Vector r, spla_Vector v, spla_OpUnary op, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_v_reduce(spla_Scalar r, spla_Scalar s, spla_Vector v, spla_OpBinary op_reduce, spla_Descriptor desc, spla_ScheduleTask* task) nogil
+    spla_Status spla_Exec_v_count_mf(spla_Scalar r, spla_Vector v, spla_Descriptor desc, spla_ScheduleTask* task) nogil
@@ -27,6 +27,7 @@ SOFTWARE.
 """
 
 import ctypes
+import threading
 
 from .bridge import backend
 from .op import OpBinary, OpSelect, OpUnary
@@ -34,7 +35,72 @@ from .op import OpBinary, OpSelect, OpUnary
 __all__ = ["Type", "BOOL", "INT", "UINT", "FLOAT", "BUILT_IN"]
 
 
-class Type:
+# Built-in op attributes mapped to (op kind, native op name). Some python
+# attribute names carry a type suffix while the native name does not.
+_OPS = {name: ("Unary", name) for name in (
+    "IDENTITY", "AINV", "MINV", "LNOT", "UONE", "ABS", "BNOT", "SQRT",
+    "LOG", "EXP", "SIN", "COS", "TAN", "ASIN", "ACOS", "ATAN", "CEIL",
+    "FLOOR", "ROUND", "TRUNC",
+)}
+_OPS.update({name: ("Binary", name) for name in (
+    "PLUS", "MINUS", "MULT", "DIV", "MINUS_POW2", "FIRST", "SECOND",
+    "BONE", "MIN", "MAX", "LOR", "LAND", "BOR", "BAND", "BXOR",
+)})
+_OPS.update({
+    "FIRST_NON_MAX_INT": ("Binary", "FIRST_NON_MAX"),
+    "MIN_NON_MAX_INT": ("Binary", "MIN_NON_MAX"),
+    "CONST_MAX_INT": ("Binary", "CONST_MAX"),
+    "SECOND_MAX_INT": ("Binary", "SECOND_MAX"),
+    "MIN_NON_ZERO_INT": ("Binary", "MIN_NON_ZERO"),
+    "S1ST_IF_SND_MAX_INT": ("Binary", "S1ST_IF_SND_MAX"),
+    "FST_MINUS_ONE_INT": ("Binary", "FST_MINUS_ONE"),
+    "SELECT_MIN_WEIGHT_UINT": ("Binary", "SELECT_MIN_WEIGHT"),
+    "CONSTRUCT_PAIR_UINT": ("Binary", "CONSTRUCT_PAIR"),
+})
+_OPS.update({name: ("Select", name) for name in (
+    "EQZERO", "NQZERO", "GTZERO", "GEZERO", "LTZERO", "LEZERO",
+    "ALWAYS", "NEVER",
+)})
+_OPS.update({
+    "EQUALS_MINF_FLOAT": ("Select", "EQUALS_MINF"),
+    "EQUALS_MAX": ("Select", "EQUALS_MAX"),
+    "NEQUALS_MAX": ("Select", "NEQUALS_MAX"),
+})
+
+
+class _TypeMeta(type):
+    """
+    Metaclass loading built-in op attributes of a type on first access.
+
+    Each op is exported by the native library as a per-type getter symbol.
+    Touching all of them during import forces hundreds of symbol
+    resolutions per type, so an op is loaded when its attribute is first
+    read and cached on the type class afterwards.
+    """
+
+    def __getattr__(cls, name):
+        spec = _OPS.get(name)
+        if spec is None or cls is Type:
+            raise AttributeError(name)
+
+        kind, op_name = spec
+        b = backend()
+        func = getattr(b, f"spla_Op{kind}_{op_name}_{cls.__name__}", None) if b else None
+
+        op = None
+        if func:
+            if kind == "Unary":
+                op = OpUnary(hnd=func(), name=op_name, dtype_res=cls, dtype_arg0=cls)
+            elif kind == "Binary":
+                op = OpBinary(hnd=func(), name=op_name, dtype_res=cls, dtype_arg0=cls, dtype_arg1=cls)
+            else:
+                op = OpSelect(hnd=func(), name=op_name, dtype_arg0=cls)
+
+        setattr(cls, name, op)
+        return op
+
+
+class Type(metaclass=_TypeMeta):
     """
     Spla base Type for storage parametrization.
 
@@ -112,6 +178,7 @@ class Type:
     _matrix_get = None
     _matrix_set = None
     _hnd = None
+    _tls = None
 
     IDENTITY: OpUnary
     AINV: OpUnary
@@ -212,102 +279,20 @@ class Type:
         return f.format("t") if value is True else f.format("f")
 
     @classmethod
-    def _setup_op_unary(cls):
-        b = backend()
-        type_name = cls.__name__
-
-        def load_op(name):
-            f = f"spla_OpUnary_{name}_{type_name}"
-            func = getattr(b, f) if hasattr(b, f) else None
-            return (
-                OpUnary(hnd=func(), name=name, dtype_res=cls, dtype_arg0=cls)
-                if func
-                else None
-            )
-
-        cls.IDENTITY = load_op("IDENTITY")
-        cls.AINV = load_op("AINV")
-        cls.MINV = load_op("MINV")
-        cls.LNOT = load_op("LNOT")
-        cls.UONE = load_op("UONE")
-        cls.ABS = load_op("ABS")
-        cls.BNOT = load_op("BNOT")
-        cls.SQRT = load_op("SQRT")
-        cls.LOG = load_op("LOG")
-        cls.EXP = load_op("EXP")
-        cls.SIN = load_op("SIN")
-        cls.COS = load_op("COS")
-        cls.TAN = load_op("TAN")
-        cls.ASIN = load_op("ASIN")
-        cls.ACOS = load_op("ACOS")
-        cls.ATAN = load_op("ATAN")
-        cls.CEIL = load_op("CEIL")
-        cls.FLOOR = load_op("FLOOR")
-        cls.ROUND = load_op("ROUND")
-        cls.TRUNC = load_op("TRUNC")
-
-    @classmethod
-    def _setup_op_binary(cls):
-        b = backend()
-        type_name = cls.__name__
-
-        def load_op(name):
-            f = f"spla_OpBinary_{name}_{type_name}"
-            func = getattr(b, f) if hasattr(b, f) else None
-            return (
-                OpBinary(
-                    hnd=func(), name=name, dtype_res=cls, dtype_arg0=cls, dtype_arg1=cls
-                )
-                if func
-                else None
-            )
-
-        cls.PLUS = load_op("PLUS")
-        cls.MINUS = load_op("MINUS")
-        cls.MULT = load_op("MULT")
-        cls.DIV = load_op("DIV")
-        cls.MINUS_POW2 = load_op("MINUS_POW2")
-        cls.FIRST = load_op("FIRST")
-        cls.SECOND = load_op("SECOND")
-        cls.BONE = load_op("BONE")
-        cls.MIN = load_op("MIN")
-        cls.MAX = load_op("MAX")
-        cls.LOR = load_op("LOR")
-        cls.LAND = load_op("LAND")
-        cls.BOR = load_op("BOR")
-        cls.BAND = load_op("BAND")
-        cls.BXOR = load_op("BXOR")
-        cls.FIRST_NON_MAX_INT = load_op("FIRST_NON_MAX")
-        cls.MIN_NON_MAX_INT = load_op("MIN_NON_MAX")
-        cls.CONST_MAX_INT = load_op("CONST_MAX")
-        cls.SECOND_MAX_INT = load_op("SECOND_MAX")
-        cls.MIN_NON_ZERO_INT = load_op("MIN_NON_ZERO")
-        cls.S1ST_IF_SND_MAX_INT = load_op("S1ST_IF_SND_MAX")
-        cls.FST_MINUS_ONE_INT = load_op("FST_MINUS_ONE")
-        cls.SELECT_MIN_WEIGHT_UINT = load_op("SELECT_MIN_WEIGHT")
-        cls.CONSTRUCT_PAIR_UINT: OpBinary = load_op("CONSTRUCT_PAIR")
-
-    @classmethod
-    def _setup_op_select(cls):
-        b = backend()
-        type_name = cls.__name__
+    def _out_cell(cls):
+        """
+        Reusable thread-local out-cell for native value reads of this type.
 
-        def load_op(name):
-            f = f"spla_OpSelect_{name}_{type_name}"
-            func = getattr(b, f) if hasattr(b, f) else None
-            return OpSelect(hnd=func(), name=name, dtype_arg0=cls) if func else None
-
-        cls.EQZERO = load_op("EQZERO")
-        cls.NQZERO = load_op("NQZERO")
-        cls.GTZERO = load_op("GTZERO")
-        cls.GEZERO = load_op("GEZERO")
-        cls.LTZERO = load_op("LTZERO")
-        cls.LEZERO = load_op("LEZERO")
-        cls.ALWAYS = load_op("ALWAYS")
-        cls.NEVER = load_op("NEVER")
-        cls.EQUALS_MINF_FLOAT = load_op("EQUALS_MINF")
-        cls.EQUALS_MAX = load_op("EQUALS_MAX")
-        cls.NEQUALS_MAX = load_op("NEQUALS_MAX")
+        :return: Tuple with ctypes value cell and its cached byref handle.
+        """
+        tls = cls._tls
+        if tls is None:
+            tls = cls._tls = threading.local()
+        out = getattr(tls, "out", None)
+        if out is None:
+            cell = cls._c_type(0)
+            out = tls.out = (cell, ctypes.byref(cell))
+        return out
 
     @classmethod
     def _setup(cls):
@@ -328,10 +313,6 @@ class Type:
         cls._matrix_set = getattr(b, f"spla_Matrix_set_{type_name_lower}")
         cls._hnd = getattr(b, f"spla_Type_{type_name}")()
 
-        cls._setup_op_unary()
-        cls._setup_op_binary()
-        cls._setup_op_select()
-
 
 class BOOL(Type):
     """Spla logical BOOL-32 type."""
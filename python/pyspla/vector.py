@@ -38,6 +38,12 @@ from .object import Object
 from .scalar import Scalar
 from .type import FLOAT, INT, UINT, Type
 
+# Shared null handles for Exec calls: a missing descriptor is a null object
+# and the schedule task out-param is always null, so one immutable instance
+# of each serves every call instead of a fresh ctypes object per operation
+_NULL_DESC = ctypes.c_void_p(0)
+_NULL_TASK = ctypes.POINTER(ctypes.c_void_p)()
+
 
 class Vector(Object):
     """
@@ -188,7 +194,7 @@ class Vector(Object):
             One of built-in storage formats to set.
         """
 
-        check(backend().spla_Vector_set_format(self.hnd, ctypes.c_int(fmt.value)))
+        check(backend().spla_Vector_set_format(self.hnd, fmt))
 
     def _set_fill_value(self, v):
         check(backend().spla_Vector_set_fill_value(self.hnd, v._hnd))
@@ -430,6 +436,43 @@ class Vector(Object):
 
         return v
 
+    @classmethod
+    def from_buffers(cls, I, V, shape, dtype=INT, zero_v=None):
+        """
+        Build vector from python buffer objects with keys and values to store in vector.
+        Buffers content is viewed directly without a copy, so building a vector of
+        millions of entries costs a fixed number of native calls instead of one
+        native call per entry as with incremental `set`.
+
+        Buffer with keys `I` must contain sorted unsigned 32-bit entries indexing
+        range [0, shape-1], buffer with values `V` must contain entries with C
+        layout of a `dtype`. Buffers must be C-contiguous.
+
+        :param I: buffer.
+             Buffer with integral keys of entries.
+
+        :param V: buffer.
+             Buffer with values to store in the vector.
+
+        :param shape: int.
+             Vector size.
+
+        :param dtype:
+             Type of storage parametrization for vector.
+
+        :return: Created vector filled with values.
+        """
+
+        assert shape > 0
+
+        view_I = MemView.from_buffer(I)
+        view_V = MemView.from_buffer(V)
+
+        v = Vector(shape=shape, dtype=dtype, zero_v=zero_v)
+        v.build(view_I, view_V)
+
+        return v
+
     @classmethod
     def rand(cls, shape, dtype=INT, density=0.1, seed=None, dist=(0, 1)):
         """
@@ -868,7 +911,7 @@ class Vector(Object):
         return zip(I, V)
 
     def _get_desc(self, desc: Descriptor):
-        return desc.hnd if desc else ctypes.c_void_p(0)
+        return desc.hnd if desc else _NULL_DESC
 
     def _get_task(self, task):
-        return ctypes.POINTER(ctypes.c_void_p)()
+        return _NULL_TASK
@@ -24,6 +24,24 @@ def get_lib_names():
             "libspla_arm64.dylib"]
 
 
+def write_build_info():
+    import platform
+    arch = {"AMD64": "x64", "x86_64": "x64", "arm64": "arm64"}[platform.machine()]
+    system = {"Darwin": "macos", "Linux": "linux", "Windows": "windows"}[platform.system()]
+    suffix = {"macos": ".dylib", "linux": ".so", "windows": ".dll"}[system]
+    prefix = {"macos": "libspla", "linux": "libspla", "windows": "spla"}[system]
+    with open(ROOT / "pyspla" / "_build_info.py", "w") as f:
+        f.write("# Generated by setup.py, do not edit\n")
+        f.write(f"TARGET = \"{prefix}_{arch}{suffix}\"\n")
+
+
+# Bake the host target library name so imports skip runtime platform
+# detection. Opt-in only: the default wheel carries libraries for all
+# platforms and must stay platform-neutral.
+if os.environ.get("PYSPLA_BAKE_TARGET"):
+    write_build_info()
+
+
 setuptools.setup(
     name="pyspla",
     version=get_version(),
@@ -73,7 +91,7 @@ setuptools.setup(
     ],
     packages=["pyspla"],
     package_dir={'': '.'},
-    package_data={'': get_lib_names()},
+    package_data={'': get_lib_names() + ["spla.pxd"]},
     python_requires=">=3.0",
     include_package_data=True
 )